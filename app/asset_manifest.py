@@ -0,0 +1,41 @@
+"""Манифест собранных статических ассетов Highest Tasks.
+
+Модуль не зависит от инструментов сборки и используется веб-приложением
+во время работы; сами ассеты собирает build_assets.py.
+"""
+
+import json
+import os
+
+DEFAULT_ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "dist")
+"""Каталог собранных ассетов, если не задан ASSETS_DIR."""
+
+MANIFEST_NAME = "manifest.json"
+"""Имя файла манифеста в каталоге собранных ассетов."""
+
+_manifests = {}
+
+
+def load_asset_manifest(directory: str) -> dict:
+    """Читает манифест собранных ассетов.
+
+    Найденный манифест запоминается до конца жизни процесса. Отсутствующий
+    не запоминается, чтобы ассеты, собранные после старта воркера, подхватились.
+
+    Args:
+        directory: Каталог собранных ассетов.
+
+    Returns:
+        Соответствие логических имён файлам с хешем или пустой словарь,
+        если ассеты не собраны.
+    """
+    manifest = _manifests.get(directory)
+    if manifest is not None:
+        return manifest
+    try:
+        with open(os.path.join(directory, MANIFEST_NAME), encoding="utf-8") as fh:
+            manifest = json.load(fh)
+    except FileNotFoundError:
+        return {}
+    _manifests[directory] = manifest
+    return manifest
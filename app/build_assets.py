@@ -0,0 +1,137 @@
+"""Сборка статических ассетов Highest Tasks.
+
+Компилирует стили Tailwind и скрипт доски в файлы с хешем содержимого
+в имени, заранее готовит их gzip- и brotli-версии и записывает манифест
+соответствия логических имён собранным файлам.
+
+Запуск из каталога ``app``::
+
+    python3 build_assets.py
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import brotli
+
+try:
+    from asset_manifest import DEFAULT_ASSETS_DIR, MANIFEST_NAME
+except ImportError:
+    from app.asset_manifest import DEFAULT_ASSETS_DIR, MANIFEST_NAME
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+"""Каталог приложения, относительно которого ищутся исходники."""
+
+SOURCE_DIR = os.path.join(APP_DIR, "static", "src")
+"""Каталог исходных файлов ассетов."""
+
+HASH_LENGTH = 12
+"""Длина хеша содержимого в имени файла."""
+
+
+def compile_stylesheet() -> bytes:
+    """Собирает минифицированный CSS из шаблонов с помощью Tailwind CLI.
+
+    Используется CLI из пакета tailwindcss-bin; источники классов
+    перечислены директивами ``@source`` в static/src/app.css.
+
+    Returns:
+        Содержимое итогового CSS-файла.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, "app.css")
+        subprocess.run(
+            [
+                sys.executable, "-m", "tailwindcss_bin",
+                "--input", os.path.join(SOURCE_DIR, "app.css"),
+                "--output", output,
+                "--minify",
+            ],
+            cwd=APP_DIR,
+            check=True,
+        )
+        with open(output, "rb") as fh:
+            return fh.read()
+
+
+def read_source(name: str) -> bytes:
+    """Читает исходный файл ассета без преобразований.
+
+    Args:
+        name: Имя файла в SOURCE_DIR.
+
+    Returns:
+        Содержимое файла.
+    """
+    with open(os.path.join(SOURCE_DIR, name), "rb") as fh:
+        return fh.read()
+
+
+def publish_asset(name: str, data: bytes, out_dir: str) -> str:
+    """Сохраняет ассет под именем с хешем содержимого и его сжатые версии.
+
+    Args:
+        name: Логическое имя ассета, например ``app.css``.
+        data: Содержимое ассета.
+        out_dir: Каталог собранных ассетов.
+
+    Returns:
+        Имя сохранённого файла, например ``app.3f2a9c1b7d4e.css``.
+    """
+    stem, ext = os.path.splitext(name)
+    digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+    hashed_name = f"{stem}.{digest}{ext}"
+    path = os.path.join(out_dir, hashed_name)
+    with open(path, "wb") as fh:
+        fh.write(data)
+    # mtime=0, чтобы одинаковый вход давал одинаковый .gz
+    with open(path + ".gz", "wb") as fh:
+        fh.write(gzip.compress(data, compresslevel=9, mtime=0))
+    with open(path + ".br", "wb") as fh:
+        fh.write(brotli.compress(data, quality=11))
+    return hashed_name
+
+
+def write_manifest(manifest: dict, out_dir: str) -> None:
+    """Записывает манифест логических имён ассетов.
+
+    Args:
+        manifest: Соответствие логических имён собранным файлам.
+        out_dir: Каталог собранных ассетов.
+    """
+    with open(os.path.join(out_dir, MANIFEST_NAME), "w", encoding="utf-8") as fh:
+        json.dump(manifest, fh, indent=2, sort_keys=True)
+
+
+def build(out_dir: str) -> dict:
+    """Собирает все ассеты приложения.
+
+    Args:
+        out_dir: Каталог собранных ассетов.
+
+    Returns:
+        Записанный манифест.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    manifest = {
+        "app.css": publish_asset("app.css", compile_stylesheet(), out_dir),
+        "board.js": publish_asset("board.js", read_source("board.js"), out_dir),
+    }
+    write_manifest(manifest, out_dir)
+    return manifest
+
+
+def main() -> None:
+    """Точка входа командной строки."""
+    out_dir = sys.argv[1] if len(sys.argv) > 1 else os.getenv("ASSETS_DIR", DEFAULT_ASSETS_DIR)
+    for name, hashed_name in build(out_dir).items():
+        print(f"{name} -> {hashed_name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 """Описание моделей БД для Highest Tasks."""
 
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import inspect, text
 from sqlalchemy.orm import relationship
 from werkzeug.security import generate_password_hash, check_password_hash
 from flask_login import UserMixin
@@ -101,5 +102,23 @@ class Card(db.Model):
     # статусы: ideas, todo, wip, done
     status = db.Column(db.String(20), nullable=False, default="ideas")
 
+    # версия для оптимистичной блокировки: растёт на 1 при каждом изменении
+    version = db.Column(db.Integer, nullable=False, default=1, server_default="1")
+
     board_id = db.Column(db.Integer, db.ForeignKey("boards.id"), nullable=False)
     board = db.relationship("Board", back_populates="cards")
+
+
+def upgrade_schema(engine) -> None:
+    """Добавляет колонки, которых нет в таблицах, созданных старыми версиями.
+
+    ``db.create_all()`` не меняет уже существующие таблицы, поэтому новые
+    колонки добавляются здесь при старте приложения.
+
+    Args:
+        engine: Движок SQLAlchemy подключённой БД.
+    """
+    columns = {column["name"] for column in inspect(engine).get_columns("cards")}
+    if "version" not in columns:
+        with engine.begin() as conn:
+            conn.execute(text("ALTER TABLE cards ADD COLUMN version INTEGER NOT NULL DEFAULT 1"))
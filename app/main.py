@@ -1,8 +1,21 @@
 """Веб-приложение Highest Tasks на Flask."""
 
+import hashlib
+import mimetypes
 import os
 from datetime import datetime, timedelta
-from flask import Flask, redirect, render_template, request, url_for, flash, jsonify
+from typing import NamedTuple
+from flask import (
+    Flask,
+    abort,
+    redirect,
+    render_template,
+    request,
+    send_from_directory,
+    url_for,
+    flash,
+    jsonify,
+)
 from flask_login import (
     LoginManager,
     login_required,
@@ -10,13 +23,19 @@ from flask_login import (
     logout_user,
     current_user,
 )
-from werkzeug.security import generate_password_hash, check_password_hash
+from jinja2 import FileSystemBytecodeCache
+from sqlalchemy import or_, select, update
+from werkzeug.security import generate_password_hash, check_password_hash, safe_join
 from werkzeug.utils import secure_filename
 
 try:
-    from db import db, Card, User, Board, Group
+    from db import db, Card, User, Board, Group, GroupMembership, upgrade_schema
+    from user_cache import UserCache
+    from asset_manifest import DEFAULT_ASSETS_DIR, load_asset_manifest
 except ImportError as exc:
-    from app.db import db, Card, User, Board, Group
+    from app.db import db, Card, User, Board, Group, GroupMembership, upgrade_schema
+    from app.user_cache import UserCache
+    from app.asset_manifest import DEFAULT_ASSETS_DIR, load_asset_manifest
 
 login_manager = LoginManager()
 """LoginManager, отвечающий за авторизацию пользователей."""
@@ -27,6 +46,36 @@ UPLOAD_FOLDER = os.path.join("static", "uploads")
 ALLOWED_EXTENSIONS = {"png", "jpg", "jpeg", "gif", "webp"}
 """Набор допустимых расширений для файлов пользователя."""
 
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+"""Заголовок Cache-Control для файлов, чьё имя меняется вместе с содержимым."""
+
+PRECOMPRESSED_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+"""Заранее сжатые варианты ассетов в порядке предпочтения."""
+
+
+class CardStatus(NamedTuple):
+    """Статус карточки и его оформление на доске."""
+
+    key: str
+    title: str
+    column_class: str
+    badge_class: str
+
+
+CARD_STATUSES = (
+    CardStatus("ideas", "Идеи", "bg-purple-100", "bg-purple-200 text-purple-700"),
+    CardStatus("todo", "Нужно сделать", "bg-gray-100", "bg-red-100 text-red-700"),
+    CardStatus("wip", "В работе", "bg-yellow-100", "bg-yellow-100 text-yellow-700"),
+    CardStatus("done", "Готово", "bg-green-100", "bg-green-100 text-green-700"),
+)
+"""Единый реестр статусов карточек в порядке колонок доски."""
+
+CARD_STATUS_BY_KEY = {status.key: status for status in CARD_STATUSES}
+"""Статусы карточек по ключу."""
+
+user_cache = UserCache()
+"""Кеш пользователей для load_user в пределах воркера."""
+
 
 class UserFacingError(Exception):
     """Исключение, отображаемое пользователю."""
@@ -52,6 +101,155 @@ def ensure_api(condition: bool, message: str, status_code: int = 400) -> None:
         raise ApiError(message, status_code)
 
 
+def board_access_filter(user_id: int):
+    """Строит SQL-условие доступа пользователя к доске.
+
+    Доступ есть у владельца доски и у участников группы, которой она принадлежит.
+
+    Args:
+        user_id: Идентификатор пользователя.
+
+    Returns:
+        Выражение SQLAlchemy для WHERE по таблице досок.
+    """
+    member_groups = select(GroupMembership.group_id).where(GroupMembership.user_id == user_id)
+    return or_(Board.owner_id == user_id, Board.owner_group_id.in_(member_groups))
+
+
+def is_group_member(user_id: int, group_id) -> bool:
+    """Проверяет членство пользователя в группе свежим запросом к БД.
+
+    Args:
+        user_id: Идентификатор пользователя.
+        group_id: Идентификатор группы или None.
+
+    Returns:
+        True, если пользователь состоит в группе.
+    """
+    if group_id is None:
+        return False
+    membership = db.session.execute(
+        select(GroupMembership.id).where(
+            GroupMembership.user_id == user_id, GroupMembership.group_id == group_id
+        )
+    ).first()
+    return membership is not None
+
+
+def card_access_filter(user_id: int):
+    """Строит SQL-условие доступа пользователя к карточке через её доску.
+
+    Args:
+        user_id: Идентификатор пользователя.
+
+    Returns:
+        Выражение SQLAlchemy для WHERE по таблице карточек.
+    """
+    return Card.board_id.in_(select(Board.id).where(board_access_filter(user_id)))
+
+
+def update_card(card_id: int, version: int, user_id: int, board_id: int | None = None, **values):
+    """Обновляет карточку одним запросом с проверкой версии и прав доступа.
+
+    Выполняет ``UPDATE ... WHERE id=? AND version=? AND <доступ> RETURNING``
+    и увеличивает версию карточки. Изменения не коммитятся.
+
+    Args:
+        card_id: Идентификатор карточки.
+        version: Версия карточки, которую видел клиент.
+        user_id: Идентификатор пользователя, выполняющего изменение.
+        board_id: Идентификатор доски, если карточка должна ей принадлежать.
+        **values: Новые значения полей карточки.
+
+    Returns:
+        Строка с полями id, status и version или None, если карточка не найдена,
+        недоступна или была изменена другим пользователем.
+    """
+    stmt = (
+        update(Card)
+        .where(Card.id == card_id, Card.version == version, card_access_filter(user_id))
+        .values(version=Card.version + 1, **values)
+        .returning(Card.id, Card.status, Card.version)
+        .execution_options(synchronize_session=False)
+    )
+    if board_id is not None:
+        stmt = stmt.where(Card.board_id == board_id)
+    return db.session.execute(stmt).first()
+
+
+def save_card(card_id: int, version: int, user_id: int, board_id: int | None = None, **values) -> bool:
+    """Обновляет карточку через update_card и фиксирует результат.
+
+    Args:
+        card_id: Идентификатор карточки.
+        version: Версия карточки, которую видел клиент.
+        user_id: Идентификатор пользователя, выполняющего изменение.
+        board_id: Идентификатор доски, если карточка должна ей принадлежать.
+        **values: Новые значения полей карточки.
+
+    Returns:
+        True, если карточка обновлена; False, если её нет, она недоступна
+        или была изменена другим пользователем.
+    """
+    if update_card(card_id, version, user_id, board_id=board_id, **values) is None:
+        db.session.rollback()
+        return False
+    db.session.commit()
+    return True
+
+
+def parse_deadline(value: str):
+    """Разбирает дедлайн из формы, введённый по МСК.
+
+    Args:
+        value: Строка в формате ДД.ММ.ГГГГ ЧЧ:ММ или пустая строка.
+
+    Returns:
+        Время в UTC или None, если дедлайн не задан.
+    """
+    if not value:
+        return None
+    try:
+        deadline_local = datetime.strptime(value, "%d.%m.%Y %H:%M")
+    except ValueError as exc:
+        raise UserFacingError(
+            "Неверный формат даты/времени дедлайна. Используйте ДД.ММ.ГГГГ ЧЧ:ММ."
+        ) from exc
+    return deadline_local - MSK_OFFSET
+
+
+def parse_version(value: str) -> int:
+    """Разбирает версию карточки из скрытого поля формы.
+
+    Args:
+        value: Значение поля ``version``.
+
+    Returns:
+        Версия карточки.
+    """
+    try:
+        return int(value)
+    except ValueError as exc:
+        raise UserFacingError("Форма устарела, обновите страницу.") from exc
+
+
+def group_cards_by_status(cards) -> list:
+    """Раскладывает карточки по колонкам доски за один проход.
+
+    Args:
+        cards: Карточки доски.
+
+    Returns:
+        Список пар (CardStatus, карточки) в порядке CARD_STATUSES.
+    """
+    cards_by_status = {status.key: [] for status in CARD_STATUSES}
+    for card in cards:
+        column = cards_by_status.get(card.status)
+        if column is not None:
+            column.append(card)
+    return [(status, cards_by_status[status.key]) for status in CARD_STATUSES]
+
+
 def allowed_file(filename: str) -> bool:
     """Проверяет допустимость расширения загружаемого файла.
 
@@ -74,6 +272,19 @@ def create_app():
     app.config["SQLALCHEMY_DATABASE_URI"] = os.getenv("SQLALCHEMY_DATABASE_URI")
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
     app.config["SECRET_KEY"] = os.getenv("APP_SECRET_KEY")
+    app.config["USER_CACHE_TTL"] = float(os.getenv("USER_CACHE_TTL", "30"))
+    app.config["USER_CACHE_SIZE"] = int(os.getenv("USER_CACHE_SIZE", "1024"))
+    app.config["ASSETS_DIR"] = os.getenv("ASSETS_DIR", DEFAULT_ASSETS_DIR)
+    app.config["JINJA_CACHE_DIR"] = os.getenv("JINJA_CACHE_DIR")
+
+    # скомпилированные шаблоны переживают перезапуск воркеров;
+    # без JINJA_CACHE_DIR Jinja берёт личный каталог пользователя с правами 0700
+    if app.config["JINJA_CACHE_DIR"]:
+        os.makedirs(app.config["JINJA_CACHE_DIR"], mode=0o700, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(app.config["JINJA_CACHE_DIR"])
+    else:
+        bytecode_cache = FileSystemBytecodeCache()
+    app.jinja_options = {**app.jinja_options, "bytecode_cache": bytecode_cache}
 
     # ensure upload dir
     app.config["UPLOAD_FOLDER"] = UPLOAD_FOLDER
@@ -82,6 +293,10 @@ def create_app():
     db.init_app(app)
     with app.app_context():
         db.create_all()
+        upgrade_schema(db.engine)
+
+    user_cache.ttl = app.config["USER_CACHE_TTL"]
+    user_cache.max_size = app.config["USER_CACHE_SIZE"]
 
     login_manager.init_app(app)
     login_manager.login_view = "login"
@@ -128,19 +343,108 @@ def datetime_msk_input(value):
 
 app.jinja_env.filters["datetime_msk"] = datetime_msk
 app.jinja_env.filters["datetime_msk_input"] = datetime_msk_input
+app.jinja_env.globals["card_statuses"] = CARD_STATUS_BY_KEY
+
+
+@app.cli.command("warm-templates")
+def warm_templates():
+    """Компилирует все шаблоны в кеш байткода, например при сборке образа."""
+    for name in app.jinja_env.list_templates():
+        app.jinja_env.get_template(name)
+
+
+_missing_assets = set()
+
+
+def asset_url(filename: str, **values) -> str:
+    """Строит URL ассета по логическому имени, аналогично url_for("static", ...).
+
+    Если ассеты не собраны (локальная разработка без build_assets.py),
+    отдаёт исходный файл из static/src; вне режимов отладки и тестирования
+    об этом пишется предупреждение в лог.
+
+    Args:
+        filename: Логическое имя ассета, например ``app.css``.
+        **values: Дополнительные аргументы для url_for.
+
+    Returns:
+        URL собранного файла с хешем в имени.
+    """
+    directory = app.config["ASSETS_DIR"]
+    hashed_name = load_asset_manifest(directory).get(filename)
+    if hashed_name is None:
+        if not (app.debug or app.testing) and (directory, filename) not in _missing_assets:
+            _missing_assets.add((directory, filename))
+            app.logger.warning(
+                "Ассет %s не собран (нет в манифесте в %s), отдаётся исходник из static/src. "
+                "Запустите build_assets.py.",
+                filename,
+                directory,
+            )
+        return url_for("static", filename=f"src/{filename}", **values)
+    return url_for("asset", filename=hashed_name, **values)
+
+
+app.jinja_env.globals["asset_url"] = asset_url
+
+
+@app.route("/assets/<path:filename>")
+def asset(filename):
+    """Отдаёт собранный ассет, по возможности в заранее сжатом виде.
+
+    Отдаются только файлы из манифеста, остальные имена дают 404.
+
+    Args:
+        filename: Имя файла с хешем содержимого.
+    """
+    directory = app.config["ASSETS_DIR"]
+    if filename not in load_asset_manifest(directory).values():
+        abort(404)
+    mimetype = mimetypes.guess_type(filename)[0]
+    for encoding, suffix in PRECOMPRESSED_ENCODINGS:
+        compressed = safe_join(directory, filename + suffix)
+        if request.accept_encodings[encoding] and compressed and os.path.isfile(compressed):
+            response = send_from_directory(directory, filename + suffix, mimetype=mimetype)
+            response.headers["Content-Encoding"] = encoding
+            break
+    else:
+        response = send_from_directory(directory, filename)
+    response.vary.add("Accept-Encoding")
+    response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+    return response
+
+
+@app.after_request
+def cache_uploads(response):
+    """Включает долгое кеширование загруженных аватаров.
+
+    Имена аватаров содержат хеш содержимого, поэтому файл по одному адресу
+    никогда не меняется.
+    """
+    filename = (request.view_args or {}).get("filename", "")
+    if (
+        request.endpoint == "static"
+        and filename.startswith("uploads/")
+        and response.status_code == 200
+    ):
+        response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+    return response
 
 
 @login_manager.user_loader
 def load_user(user_id):
     """Загружает пользователя по идентификатору для Flask-Login.
 
+    Пользователь берётся из user_cache, поэтому обычный
+    просмотр страницы не делает запросов для идентификации.
+
     Args:
         user_id: Идентификатор пользователя из сессии.
 
     Returns:
         Объект пользователя или None, если не найден.
     """
-    return db.session.get(User, int(user_id))
+    return user_cache.get(int(user_id))
 
 
 @app.route("/")
@@ -218,12 +522,10 @@ def boards():
         except UserFacingError as exc:
             error = str(exc)
     user_boards = (
-        Board.query.filter_by(owner_id=current_user.id).order_by(Board.id.desc()).all()
+        Board.query.filter(board_access_filter(current_user.id))
+        .order_by(Board.id.desc())
+        .all()
     )
-    for grp in current_user.groups:
-        for brd in grp.boards:
-            if brd not in user_boards:
-                user_boards.append(brd)
     return render_template("boards.html", boards=user_boards, error=error)
 
 
@@ -235,22 +537,16 @@ def board(board_id):
     Args:
         board_id: Идентификатор доски.
     """
-    board = Board.query.filter_by(id=board_id).first_or_404()
+    board = Board.query.filter(Board.id == board_id, board_access_filter(current_user.id)).first()
     try:
-        has_group_access = (
-            board.owner_group is not None and current_user in board.owner_group.users
-        )
-        ensure(current_user == board.owner or has_group_access, "У вас нет доступа к этой доске")
+        if board is None:
+            # отличаем несуществующую доску от чужой только на неуспешном пути
+            Board.query.filter_by(id=board_id).first_or_404()
+        ensure(board is not None, "У вас нет доступа к этой доске")
     except UserFacingError as exc:
         flash(str(exc), "error")
         return redirect(url_for("boards"))
 
-    statuses = [
-        ("ideas", "Идеи"),
-        ("todo", "To Do"),
-        ("wip", "В работе"),
-        ("done", "Готово"),
-    ]
     if request.method == "POST":
         try:
             name = request.form.get("name", "").strip()
@@ -266,7 +562,7 @@ def board(board_id):
             if not task_creator:
                 task_creator = current_user.username or ""
             ensure(name, "Название задачи не может быть пустым.")
-            ensure(status in [s for s, _ in statuses], "Неверный статус задачи.")
+            ensure(status in CARD_STATUS_BY_KEY, "Неверный статус задачи.")
             card = Card(
                 name=name,
                 task_creator=task_creator,
@@ -284,11 +580,11 @@ def board(board_id):
         except UserFacingError as exc:
             flash(str(exc), "error")
     tasks = Card.query.filter_by(board_id=board.id).order_by(Card.id.desc()).all()
+    columns = group_cards_by_status(tasks)
     available_groups = current_user.groups
     return render_template(
         "board.html",
-        tasks=tasks,
-        statuses=statuses,
+        columns=columns,
         board=board,
         available_groups=available_groups,
     )
@@ -302,9 +598,9 @@ def remove_board_from_group():
     board = Board.query.filter_by(id=board_id).first_or_404()
 
     try:
-        ensure(board.owner_group is not None, "Доска не принадлежит группе.")
-        ensure(current_user in board.owner_group.users, "У вас нет прав на изменение этой группы")
-        ensure(current_user == board.owner, "Только владелец доски может менять группу")
+        ensure(board.owner_group_id is not None, "Доска не принадлежит группе.")
+        ensure(is_group_member(current_user.id, board.owner_group_id), "У вас нет прав на изменение этой группы")
+        ensure(board.owner_id == current_user.id, "Только владелец доски может менять группу")
     except UserFacingError as exc:
         flash(str(exc), "error")
         return redirect(url_for("board", board_id=board_id))
@@ -326,8 +622,8 @@ def add_board_to_group():
     group = Group.query.filter_by(id=group_id).first_or_404()
 
     try:
-        ensure(current_user in group.users, "У вас нет прав на изменение этой группы")
-        ensure(current_user == board.owner, "Только владелец доски может менять группу")
+        ensure(is_group_member(current_user.id, group.id), "У вас нет прав на изменение этой группы")
+        ensure(board.owner_id == current_user.id, "Только владелец доски может менять группу")
     except UserFacingError as exc:
         flash(str(exc), "error")
         return redirect(url_for("board", board_id=board_id))
@@ -348,10 +644,8 @@ def card_detail(board_id, card_id):
         board_id: Идентификатор доски.
         card_id: Идентификатор карточки.
     """
-    board = Board.query.filter_by(id=board_id, owner_id=current_user.id).first_or_404()
-    card = Card.query.filter_by(board_id=board.id, id=card_id).first_or_404()
-
     error = None
+    conflict = False
     form_description = None
     form_deadline = None
 
@@ -359,24 +653,30 @@ def card_detail(board_id, card_id):
         try:
             form_description = request.form.get("task_description", "").strip()
             form_deadline = request.form.get("deadline", "").strip()
-            new_deadline = None
-            if form_deadline:
-                try:
-                    deadline_local = datetime.strptime(form_deadline, "%d.%m.%Y %H:%M")
-                    new_deadline = deadline_local - MSK_OFFSET
-                except ValueError as exc:
-                    raise UserFacingError(
-                        "Неверный формат даты/времени дедлайна. Используйте ДД.ММ.ГГГГ ЧЧ:ММ."
-                    ) from exc
-
-            card.task_description = form_description
-            card.deadline = new_deadline
-            db.session.commit()
-            flash("Задача обновлена", "success")
-            return redirect(url_for("card_detail", board_id=board.id, card_id=card.id))
+            saved = save_card(
+                card_id,
+                parse_version(request.form.get("version", "")),
+                current_user.id,
+                board_id=board_id,
+                task_description=form_description,
+                deadline=parse_deadline(form_deadline),
+            )
+            if saved:
+                flash("Задача обновлена", "success")
+                return redirect(url_for("card_detail", board_id=board_id, card_id=card_id))
+            # карточки нет, нет доступа (ниже ответим 404) или версия устарела
+            conflict = True
         except UserFacingError as exc:
             error = str(exc)
 
+    board = Board.query.filter(
+        Board.id == board_id, board_access_filter(current_user.id)
+    ).first_or_404()
+    card = Card.query.filter_by(board_id=board.id, id=card_id).first_or_404()
+
+    if conflict:
+        error = "Задачу уже изменил другой пользователь. Проверьте актуальные данные и сохраните ещё раз."
+
     return render_template(
         "card_detail.html",
         board=board,
@@ -384,7 +684,7 @@ def card_detail(board_id, card_id):
         error=error,
         form_description=form_description,
         form_deadline=form_deadline,
-    )
+    ), (409 if conflict else 200)
 
 
 @app.route("/profile", methods=["GET"])
@@ -414,13 +714,17 @@ def profile_edit():
                     "Неверный формат файла. Разрешены: png, jpg, jpeg, gif, webp.",
                 )
                 fname = secure_filename(file.filename)
-                name, ext = os.path.splitext(fname)
-                final_name = f"{current_user.id}_{name}{ext}"
+                _, ext = os.path.splitext(fname)
+                # хеш в имени: новый аватар получает новый URL и не застревает в кеше
+                digest = hashlib.sha256(file.read()).hexdigest()[:12]
+                file.seek(0)
+                final_name = f"{current_user.id}_{digest}{ext}"
                 save_path = os.path.join(app.config["UPLOAD_FOLDER"], final_name)
                 file.save(save_path)
                 current_user.avatar_url = f"/{save_path.replace(os.sep, '/')}"
 
             db.session.commit()
+            user_cache.invalidate(current_user.id)
             flash("Профиль обновлён", "success")
             return redirect(url_for("profile"))
         except UserFacingError as exc:
@@ -441,6 +745,7 @@ def groups():
             new_group.users.append(current_user)
             db.session.add(new_group)
             db.session.commit()
+            user_cache.invalidate(current_user.id)
             flash("Группа создана", "success")
             return redirect(url_for("groups"))
         except UserFacingError as exc:
@@ -466,6 +771,7 @@ def group_detail(group_id):
             ensure(user not in grp.users, "Пользователь уже в группе.")
             grp.users.append(user)
             db.session.commit()
+            user_cache.invalidate(user.id)
             flash("Пользователь добавлен в группу", "success")
             return redirect(url_for("group_detail", group_id=group_id))
         except UserFacingError as exc:
@@ -482,16 +788,18 @@ def remove_user_from_group():
     user_id = request.form.get("user_id")
     grp = Group.query.filter_by(id=group_id).first_or_404()
     user = User.query.filter_by(id=user_id).first()
+    is_member = is_group_member(current_user.id, grp.id)
     try:
-        ensure(current_user in grp.users, "У вас нет прав на изменение этой группы")
+        ensure(is_member, "У вас нет прав на изменение этой группы")
         ensure(current_user != user, "Вы не можете удалить себя из группы")
         ensure(user is not None and user in grp.users, "Пользователь уже удалён из группы")
         grp.users.remove(user)
         db.session.commit()
+        user_cache.invalidate(user.id)
         flash("Пользователь удалён из группы", "info")
     except UserFacingError as exc:
         flash(str(exc), "error")
-        if current_user not in grp.users:
+        if not is_member:
             return redirect(url_for("groups"))
         return redirect(url_for("group_detail", group_id=group_id))
     return redirect(url_for("group_detail", group_id=group_id))
@@ -512,34 +820,44 @@ def move_card():
 
         card_id = data.get("card_id")
         new_status = data.get("new_status")
-        ensure_api(card_id and new_status, "card_id and new_status are required")
+        version = data.get("version")
+        ensure_api(
+            card_id and new_status and version is not None,
+            "card_id, new_status and version are required",
+        )
 
         try:
             card_id_int = int(card_id)
         except (ValueError, TypeError) as exc:
             raise ApiError("Invalid card_id") from exc
+        try:
+            version_int = int(version)
+        except (ValueError, TypeError) as exc:
+            raise ApiError("Invalid version") from exc
+
+        ensure_api(new_status in CARD_STATUS_BY_KEY, "Invalid status")
+
+        updated = update_card(card_id_int, version_int, current_user.id, status=new_status)
+        if updated is None:
+            db.session.rollback()
+            # разбираем причину отказа только на неуспешном пути
+            card = db.session.get(Card, card_id_int)
+            ensure_api(card is not None, "Card not found", status_code=404)
+            has_access = db.session.execute(
+                select(Board.id).where(Board.id == card.board_id, board_access_filter(current_user.id))
+            ).first()
+            ensure_api(has_access is not None, "Permission denied", status_code=403)
+            raise ApiError("Card was modified by another user", 409)
 
-        card = Card.query.filter_by(id=card_id_int).first()
-        ensure_api(card is not None, "Card not found", status_code=404)
-
-        board = Board.query.filter_by(id=card.board_id).first()
-        ensure_api(board is not None, "Board not found", status_code=404)
-
-        has_group_access = (
-            board.owner_group is not None and current_user in board.owner_group.users
-        )
-        ensure_api(
-            current_user == board.owner or has_group_access,
-            "Permission denied",
-            status_code=403,
-        )
-
-        valid_statuses = {"ideas", "todo", "wip", "done"}
-        ensure_api(new_status in valid_statuses, "Invalid status")
-
-        card.status = new_status
         db.session.commit()
-        return jsonify({"ok": True, "card_id": card.id, "new_status": card.status}), 200
+        return jsonify(
+            {
+                "ok": True,
+                "card_id": updated.id,
+                "new_status": updated.status,
+                "version": updated.version,
+            }
+        ), 200
     except ApiError as exc:
         return jsonify({"error": str(exc)}), exc.status_code
 
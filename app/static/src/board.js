@@ -0,0 +1,86 @@
+// Перетаскивание карточек между колонками доски.
+// Адрес API и классы бейджей передаются из шаблона через data-атрибуты.
+const moveUrl = document.currentScript.dataset.moveUrl;
+
+document.addEventListener('DOMContentLoaded', function () {
+  function badgeClassesForColumn(column) {
+    return (column.dataset.badgeClass || '').split(' ').filter(Boolean);
+  }
+
+  function updatePlaceholder(column) {
+    const placeholder = column.querySelector('.empty-placeholder');
+    if (!placeholder) {
+      return;
+    }
+    const hasCards = column.querySelectorAll('[data-card-id]').length > 0;
+    placeholder.style.display = hasCards ? 'none' : 'block';
+  }
+
+  function bindCard(card) {
+    card.addEventListener('dragstart', function (e) {
+      e.dataTransfer.setData('text/plain', card.dataset.cardId);
+      card.classList.add('opacity-50');
+    });
+    card.addEventListener('dragend', function () {
+      card.classList.remove('opacity-50');
+    });
+  }
+
+  document.querySelectorAll('[draggable="true"]').forEach(bindCard);
+
+  document.querySelectorAll('.column-cards').forEach(function (col) {
+    updatePlaceholder(col);
+    col.addEventListener('dragover', function (e) { e.preventDefault(); });
+    col.addEventListener('drop', async function (e) {
+      e.preventDefault();
+      const cardId = e.dataTransfer.getData('text/plain');
+      if (!cardId) return;
+      const cardEl = document.querySelector('[data-card-id="' + cardId + '"]');
+      if (!cardEl) return;
+      const newStatus = col.dataset.status;
+      const oldStatus = cardEl.dataset.cardStatus;
+      if (newStatus === oldStatus) return;
+
+      const sourceColumn = cardEl.closest('.column-cards');
+      col.appendChild(cardEl);
+      cardEl.dataset.cardStatus = newStatus;
+      updatePlaceholder(col);
+      if (sourceColumn && sourceColumn !== col) {
+        updatePlaceholder(sourceColumn);
+      }
+
+      const badge = cardEl.querySelector('.status-badge');
+      if (badge) {
+        badge.textContent = newStatus;
+        badge.className = 'status-badge text-xs px-2 py-1 rounded whitespace-nowrap';
+        const extra = badgeClassesForColumn(col);
+        extra.forEach(c => badge.classList.add(c));
+      }
+
+      try {
+        const res = await fetch(moveUrl, {
+          method: 'POST',
+          credentials: 'same-origin',
+          headers: { 'Content-Type': 'application/json' },
+          body: JSON.stringify({
+            card_id: cardId,
+            new_status: newStatus,
+            version: Number(cardEl.dataset.cardVersion)
+          })
+        });
+        if (res.ok) {
+          const data = await res.json();
+          cardEl.dataset.cardVersion = data.version;
+        } else {
+          let data = {};
+          try { data = await res.json(); } catch (e) {}
+          alert('Не удалось изменить статус задачи: ' + (data.error || res.status));
+          window.location.reload();
+        }
+      } catch (err) {
+        alert('Ошибка сети при перемещении задачи');
+        window.location.reload();
+      }
+    });
+  });
+});
@@ -6,11 +6,19 @@ os.environ["APP_SECRET_KEY"] = "test-secret"
 import pytest
 from app.main import app as flask_app
 from app.db import db
+from app.build_assets import build
 
 
 @pytest.fixture(scope="session")
-def app():
-    flask_app.config.update(TESTING=True)
+def assets_dir(tmp_path_factory):
+    directory = str(tmp_path_factory.mktemp("assets"))
+    build(directory)
+    return directory
+
+
+@pytest.fixture(scope="session")
+def app(assets_dir):
+    flask_app.config.update(TESTING=True, ASSETS_DIR=assets_dir)
     with flask_app.app_context():
         db.create_all()
     yield flask_app
@@ -1,5 +1,10 @@
 import datetime
 
+from sqlalchemy import create_engine, inspect, text
+
+from app.asset_manifest import load_asset_manifest
+from app.build_assets import write_manifest
+from app.db import upgrade_schema
 from app.main import datetime_msk, allowed_file
 
 
@@ -11,4 +16,24 @@ def test_allowed_extensions():
     assert allowed_file("sticker.webp")
     assert not allowed_file("okak.zip")
     assert allowed_file("meow.png")
-    assert not allowed_file("hackersky.script.py")
\ No newline at end of file
+    assert not allowed_file("hackersky.script.py")
+
+
+def test_missing_asset_manifest_is_not_cached(tmp_path):
+    assert load_asset_manifest(str(tmp_path)) == {}
+    write_manifest({"app.css": "app.0123456789ab.css"}, str(tmp_path))
+    assert load_asset_manifest(str(tmp_path)) == {"app.css": "app.0123456789ab.css"}
+
+
+def test_upgrade_schema_adds_card_version(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE cards (id INTEGER PRIMARY KEY, name VARCHAR(100))"))
+        conn.execute(text("INSERT INTO cards (id, name) VALUES (1, 'old')"))
+
+    upgrade_schema(engine)
+    upgrade_schema(engine)
+
+    assert "version" in {column["name"] for column in inspect(engine).get_columns("cards")}
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT version FROM cards WHERE id = 1")).scalar() == 1
@@ -1,6 +1,11 @@
 import re
 from random import randint
 
+from sqlalchemy import event
+
+from app.db import db, GroupMembership
+from app.main import CARD_STATUSES, asset_url, user_cache
+
 
 def test_pages_render(client):
     assert client.get("/").status_code == 200
@@ -56,4 +61,202 @@ def test_create_board_and_task_success(client):
         follow_redirects=True
     )
     assert r.status_code == 200
-    assert b"Crazy Task" in r.data
\ No newline at end of file
+    assert b"Crazy Task" in r.data
+
+
+def _create_board_with_task(client, username):
+    client.post("/register", data={"username": username, "password": "verysecure"})
+    client.post("/login", data={"username": username, "password": "verysecure"})
+    r = client.post("/boards", data={"name": "board"}, follow_redirects=True)
+    board_id = int(re.findall(rb"href=\"/board/(\d+)", r.data)[0])
+    r = client.post(f"/board/{board_id}", data={"name": "Task"}, follow_redirects=True)
+    card_id = int(re.findall(rb"data-card-id=\"(\d+)\"", r.data)[0])
+    return board_id, card_id
+
+
+def test_move_card_version_conflict(client):
+    _, card_id = _create_board_with_task(client, "dave" + str(randint(100, 200)))
+
+    r = client.post("/card/move", json={"card_id": card_id, "new_status": "wip", "version": 1})
+    assert r.status_code == 200
+    assert r.get_json()["version"] == 2
+
+    r = client.post("/card/move", json={"card_id": card_id, "new_status": "done", "version": 1})
+    assert r.status_code == 409
+
+    r = client.post("/card/move", json={"card_id": 10**6, "new_status": "done", "version": 1})
+    assert r.status_code == 404
+
+
+def test_move_card_permission_denied(client):
+    _, card_id = _create_board_with_task(client, "erin" + str(randint(100, 200)))
+    client.get("/logout")
+    client.post("/register", data={"username": "mallory", "password": "verysecure"})
+    client.post("/login", data={"username": "mallory", "password": "verysecure"})
+
+    r = client.post("/card/move", json={"card_id": card_id, "new_status": "done", "version": 1})
+    assert r.status_code == 403
+
+
+def test_card_detail_version_conflict(client):
+    board_id, card_id = _create_board_with_task(client, "frank" + str(randint(100, 200)))
+    url = f"/board/{board_id}/card/{card_id}"
+
+    r = client.post(url, data={"task_description": "first", "deadline": "", "version": "1"})
+    assert r.status_code in (302, 303)
+
+    r = client.post(url, data={"task_description": "stale", "deadline": "", "version": "1"})
+    assert r.status_code == 409
+    assert b'name="version" value="2"' in r.data
+
+
+def test_cached_user_page_view_without_queries(app, client):
+    username = "grace" + str(randint(100, 200))
+    client.post("/register", data={"username": username, "password": "verysecure"})
+    client.post("/login", data={"username": username, "password": "verysecure"})
+    client.get("/profile")
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        assert client.get("/profile").status_code == 200
+        assert client.get("/").status_code == 200
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert statements == []
+
+
+def test_profile_edit_invalidates_user_cache(client):
+    username = "heidi" + str(randint(100, 200))
+    client.post("/register", data={"username": username, "password": "verysecure"})
+    client.post("/login", data={"username": username, "password": "verysecure"})
+    client.get("/profile")
+
+    r = client.post("/profile/edit", data={"full_name": "Heidi Klum", "bio": ""})
+    assert r.status_code in (302, 303)
+    assert "Heidi Klum" in client.get("/profile").get_data(as_text=True)
+
+
+def test_board_access_is_checked_against_database(app):
+    owner, member = app.test_client(), app.test_client()
+    member_name = "ivan" + str(randint(100, 200))
+    member.post("/register", data={"username": member_name, "password": "verysecure"})
+    member.post("/login", data={"username": member_name, "password": "verysecure"})
+    member.get("/boards")
+
+    board_id, _ = _create_board_with_task(owner, "judy" + str(randint(100, 200)))
+    r = owner.post("/groups", data={"name": "team"}, follow_redirects=True)
+    group_id = int(re.findall(rb"href=\"/group/(\d+)", r.data)[-1])
+    r = owner.get(f"/group/{group_id}")
+    member_id = int(re.findall(rf"value=\"(\d+)\">[^<]*\(@{member_name}\)".encode(), r.data)[0])
+    owner.post(f"/group/{group_id}", data={"user_id": member_id})
+    owner.post("/board/add_group", data={"board_id": board_id, "group_id": group_id})
+
+    assert member.get(f"/board/{board_id}").status_code == 200
+
+    # другой воркер убрал участника из группы: кеш пользователя не сброшен,
+    # но доступ к доске проверяется по БД
+    with app.app_context():
+        GroupMembership.query.filter_by(user_id=member_id, group_id=group_id).delete()
+        db.session.commit()
+    r = member.get(f"/board/{board_id}")
+    assert r.status_code in (302, 303)
+    assert r.headers["Location"].endswith("/boards")
+
+
+def test_board_groups_cards_by_status(client):
+    board_id, card_id = _create_board_with_task(client, "kate" + str(randint(100, 200)))
+    client.post("/card/move", json={"card_id": card_id, "new_status": "wip", "version": 1})
+
+    page = client.get(f"/board/{board_id}").get_data(as_text=True)
+    wip_column = page.index('data-status="wip"')
+    done_column = page.index('data-status="done"')
+    assert wip_column < page.index(f'data-card-id="{card_id}"') < done_column
+    assert 'data-status="wip" data-badge-class="bg-yellow-100 text-yellow-700"' in page
+
+
+def test_pages_reference_only_local_hashed_assets(client):
+    board_id, card_id = _create_board_with_task(client, "leo" + str(randint(100, 200)))
+
+    assets = set()
+    for url in ("/", "/boards", f"/board/{board_id}", f"/board/{board_id}/card/{card_id}", "/profile"):
+        page = client.get(url).get_data(as_text=True)
+        assert "cdn.tailwindcss.com" not in page
+        refs = re.findall(r"<script[^>]*\ssrc=\"([^\"]+)\"", page)
+        refs += re.findall(r"<link[^>]*\shref=\"([^\"]+)\"", page)
+        assert refs
+        for ref in refs:
+            assert re.fullmatch(r"/assets/[\w-]+\.[0-9a-f]{12}\.(css|js)", ref), ref
+        assets.update(refs)
+    assert any(ref.endswith(".js") for ref in assets)
+
+    for ref in assets:
+        r = client.get(ref, headers={"Accept-Encoding": "gzip, br"})
+        assert r.status_code == 200
+        assert r.headers["Content-Encoding"] == "br"
+        assert r.headers["Cache-Control"] == "public, max-age=31536000, immutable"
+        assert "Accept-Encoding" in r.headers["Vary"]
+
+        r = client.get(ref)
+        assert r.status_code == 200
+        assert "Content-Encoding" not in r.headers
+
+
+def test_compiled_stylesheet_has_status_classes(client, assets_dir):
+    page = client.get("/").get_data(as_text=True)
+    css_url = re.findall(r"<link[^>]*\shref=\"([^\"]+\.css)\"", page)[0]
+    css = client.get(css_url).get_data(as_text=True)
+    assert "@tailwind" not in css
+    for status in CARD_STATUSES:
+        for cls in (status.column_class + " " + status.badge_class).split():
+            assert "." + cls + "{" in css, cls
+
+
+def test_missing_upload_is_not_cached(client):
+    r = client.get("/static/uploads/nope.png")
+    assert r.status_code == 404
+    assert "immutable" not in r.headers.get("Cache-Control", "")
+
+
+def test_group_membership_endpoints_invalidate_user_cache(app):
+    owner, member = app.test_client(), app.test_client()
+    member_name = "mike" + str(randint(100, 200))
+    member.post("/register", data={"username": member_name, "password": "verysecure"})
+    member.post("/login", data={"username": member_name, "password": "verysecure"})
+    member.get("/")
+
+    _create_board_with_task(owner, "nina" + str(randint(100, 200)))
+    r = owner.post("/groups", data={"name": "team"}, follow_redirects=True)
+    group_id = int(re.findall(rb"href=\"/group/(\d+)", r.data)[-1])
+    r = owner.get(f"/group/{group_id}")
+    member_id = int(re.findall(rf"value=\"(\d+)\">[^<]*\(@{member_name}\)".encode(), r.data)[0])
+    assert member_id in user_cache
+
+    owner.post(f"/group/{group_id}", data={"user_id": member_id})
+    assert member_id not in user_cache
+
+    member.get("/")
+    assert member_id in user_cache
+    owner.post("/group/delete", data={"group_id": group_id, "user_id": member_id})
+    assert member_id not in user_cache
+
+
+def test_asset_view_serves_only_manifest_files(client):
+    assert client.get("/assets/manifest.json").status_code == 404
+    assert client.get("/assets/board.js").status_code == 404
+
+
+def test_missing_asset_build_is_logged(app, assets_dir, tmp_path, caplog):
+    app.config.update(TESTING=False, ASSETS_DIR=str(tmp_path))
+    try:
+        with app.test_request_context():
+            assert asset_url("app.css") == "/static/src/app.css"
+    finally:
+        app.config.update(TESTING=True, ASSETS_DIR=assets_dir)
+    assert "build_assets.py" in caplog.text
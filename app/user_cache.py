@@ -0,0 +1,94 @@
+"""Кеш пользователей для Flask-Login в пределах одного воркера."""
+
+import threading
+import time
+from collections import OrderedDict
+
+from sqlalchemy.orm import make_transient_to_detached
+
+try:
+    from db import db, User
+except ImportError:
+    from app.db import db, User
+
+
+class UserCache:
+    """LRU-кеш строк пользователей с ограниченным временем жизни.
+
+    Хранит отсоединённые от сессии копии пользователей, поэтому попадание
+    в кеш не требует запросов к БД. Кеш живёт в памяти воркера: изменения,
+    сделанные в других воркерах, становятся видны не позже чем через ``ttl``.
+    Кешируется только личность пользователя; права доступа и членство
+    в группах всегда проверяются по БД.
+    """
+
+    def __init__(self, ttl: float = 30.0, max_size: int = 1024) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int):
+        """Возвращает пользователя, привязанного к текущей сессии БД.
+
+        Args:
+            user_id: Идентификатор пользователя.
+
+        Returns:
+            Объект пользователя или None, если не найден.
+        """
+        snapshot = self._lookup(user_id)
+        if snapshot is None:
+            snapshot = self._load(user_id)
+            if snapshot is None:
+                return None
+            self._store(user_id, snapshot)
+        # load=False прикрепляет копию к сессии без SELECT
+        return db.session.merge(snapshot, load=False)
+
+    def __contains__(self, user_id: int) -> bool:
+        """Проверяет, есть ли пользователь в кеше, без учёта срока жизни."""
+        with self._lock:
+            return user_id in self._entries
+
+    def invalidate(self, user_id: int) -> None:
+        """Удаляет пользователя из кеша.
+
+        Args:
+            user_id: Идентификатор пользователя.
+        """
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        """Полностью очищает кеш."""
+        with self._lock:
+            self._entries.clear()
+
+    def _lookup(self, user_id: int):
+        with self._lock:
+            item = self._entries.get(user_id)
+            if item is None:
+                return None
+            expires_at, entry = item
+            if expires_at < time.monotonic():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return entry
+
+    def _store(self, user_id: int, entry) -> None:
+        with self._lock:
+            self._entries[user_id] = (time.monotonic() + self.ttl, entry)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    @staticmethod
+    def _load(user_id: int):
+        user = db.session.get(User, user_id)
+        if user is None:
+            return None
+        snapshot = User(**{col.key: getattr(user, col.key) for col in User.__table__.columns})
+        make_transient_to_detached(snapshot)
+        return snapshot
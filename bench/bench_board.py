@@ -0,0 +1,94 @@
+"""Бенчмарк отрисовки доски с большим числом карточек.
+
+Запуск из корня репозитория::
+
+    python3 bench/bench_board.py --cards 5000 --repeat 20
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", "sqlite:///:memory:")
+os.environ.setdefault("APP_SECRET_KEY", "bench-secret")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.main import app  # noqa: E402
+from app.db import db, Board, Card, User  # noqa: E402
+
+STATUSES = ("ideas", "todo", "wip", "done")
+
+
+def seed(cards: int) -> int:
+    """Создаёт пользователя и доску с заданным числом карточек."""
+    with app.app_context():
+        user = User(username="bench")
+        user.set_password("benchpassword")
+        board = Board(name="bench", owner=user)
+        db.session.add(board)
+        db.session.flush()
+        db.session.add_all(
+            Card(
+                name=f"Задача {i}",
+                task_creator="bench",
+                task_assignee="someone",
+                task_description="Описание задачи " * 3,
+                status=STATUSES[i % len(STATUSES)],
+                board_id=board.id,
+                created_at=datetime.utcnow(),
+            )
+            for i in range(cards)
+        )
+        db.session.commit()
+        return board.id
+
+
+def bench_render(board_id: int, repeat: int) -> list:
+    """Замеряет время ответа GET /board/<id> при прогретых шаблонах."""
+    client = app.test_client()
+    client.post("/login", data={"username": "bench", "password": "benchpassword"})
+    client.get(f"/board/{board_id}")
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = client.get(f"/board/{board_id}")
+        timings.append(time.perf_counter() - start)
+        assert response.status_code == 200
+    return timings
+
+
+def bench_cold_load(repeat: int) -> list:
+    """Замеряет загрузку board.html в свежем окружении Jinja, как в новом воркере."""
+    timings = []
+    for _ in range(repeat):
+        env = app.create_jinja_environment()
+        start = time.perf_counter()
+        env.get_template("board.html")
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def report(title: str, timings: list) -> None:
+    """Печатает медиану и минимум в миллисекундах."""
+    print(
+        f"{title}: median {statistics.median(timings) * 1000:.1f} ms, "
+        f"min {min(timings) * 1000:.1f} ms ({len(timings)} runs)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cards", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    board_id = seed(args.cards)
+    report(f"GET /board ({args.cards} cards)", bench_render(board_id, args.repeat))
+    report("board.html cold load", bench_cold_load(args.repeat))
+
+
+if __name__ == "__main__":
+    main()